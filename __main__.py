@@ -10,9 +10,14 @@ By centralizing the startup logic here, the application can be run both as a scr
 from controller import PhotoSorterController
 
 # Define the main function that initializes the controller and starts the GUI event loop.
+# cleanup() runs even if the main loop raises, so background workers and
+# pending config writes are never leaked.
 def main():
     app = PhotoSorterController()
-    app.view.mainloop()
+    try:
+        app.run()
+    finally:
+        app.cleanup()
 
 # Ensure the application starts only when this file is executed directly.
 if __name__ == "__main__":
@@ -10,25 +10,59 @@ Use this module to load and save configuration data in a consistent and reliable
 # --- Imports ---
 # Import standard libraries for JSON handling and file path management.
 import json
+import os
 from pathlib import Path
 
+# orjson (C implementation) parses and serializes JSON several times faster than
+# the stdlib module. It is optional: when not installed, stdlib json is used.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# --- JSON helpers ---
+# Encode/decode the config as bytes, dispatching to orjson when available.
+def _loads(data: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumps(cfg: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(cfg, option=orjson.OPT_INDENT_2)
+    return json.dumps(cfg, indent=2).encode()
+
 # --- Configuration File Path ---
 # Define the path to the configuration file in the user's home directory.
 CONFIG_PATH = Path.home() / ".photosorter_config.json"
 
+# --- In-Memory Cache ---
+# The parsed config is kept as a module-level singleton: the file is read from
+# disk at most once per process, and saves update the cache alongside the file.
+_cache: dict | None = None
+
 # --- Configuration Load Function ---
 # Loads configuration from the JSON file if it exists, otherwise returns default settings.
 # Ensures 'ui_backend' is set to 'dearpygui' by default for future UI backend selection.
 def load_config() -> dict:
+    global _cache
+    if _cache is not None:
+        return _cache
     if CONFIG_PATH.exists():
-        with open(CONFIG_PATH, 'r') as f:
-            cfg = json.load(f)
+        cfg = _loads(CONFIG_PATH.read_bytes())
         cfg.setdefault("ui_backend", "dearpygui")
-        return cfg
-    return {"categories": [], "last_folder": "", "ui_backend": "dearpygui"}
+    else:
+        cfg = {"categories": [], "last_folder": "", "ui_backend": "dearpygui"}
+    _cache = cfg
+    return cfg
 
 # --- Configuration Save Function ---
 # Saves the provided configuration dictionary to the JSON file, creating it if necessary.
+# Writes to a temporary file first and then renames it over the target, so a crash
+# mid-write can never leave a truncated or half-written config behind.
 def save_config(cfg: dict) -> None:
-    with open(CONFIG_PATH, 'w') as f:
-        json.dump(cfg, f, indent=2)
+    global _cache
+    _cache = cfg
+    tmp_path = CONFIG_PATH.with_suffix('.json.tmp')
+    tmp_path.write_bytes(_dumps(cfg))
+    os.replace(tmp_path, CONFIG_PATH)
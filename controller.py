@@ -4,15 +4,21 @@
 
 from pathlib import Path
 from config import load_config, save_config
-from model import list_images, move_image, create_thumbnail
+from model import list_images_with_stats, move_image, get_or_build_thumbnail, prune_thumbnail_cache
 from view.factory import create_view
 from view.dialogs import configure_category, show_error
 from typing import Callable
-import threading  # For background thumbnail preloading
+from collections import OrderedDict
+import atexit
+import bisect
+import os
+import threading  # For debounced config saves
+from concurrent.futures import ThreadPoolExecutor  # For background thumbnail preloading
 from view.dearpygui_view import DearPyGuiView
 
 class PhotoSorterController:
     THUMBNAIL_PRELOAD_COUNT = 15  # Number of thumbnails to preload for instant navigation
+    THUMBNAIL_CACHE_SIZE = 128    # LRU cap; each cached thumbnail is ~1MB of RGBA data
 
     def __init__(self):
         # Load configuration and initialize state
@@ -20,8 +26,27 @@ class PhotoSorterController:
         last_folder = self.config.get("last_folder", "")
         self.current_folder = None
         self.images = []
+        self.images_stat = []  # stat results parallel to self.images, reused for file sizes
+        self._images_alive = []  # Tombstones: False marks sorted-away entries (see assign_category)
+        self._dead_count = 0
         self.current_index = 0
-        self.thumbnail_cache = {}  # Cache for thumbnails
+        self.thumbnail_cache = OrderedDict()  # LRU cache for thumbnails (see _cache_thumbnail)
+        # Thread pool for parallel thumbnail preloading. Pillow's JPEG decode
+        # releases the GIL, so decoding scales across cores.
+        self._thumb_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4))
+        # Separate small pool for file moves, so a slow cross-device copy
+        # never blocks the UI or starves thumbnail preloading
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        # Incremented on every folder switch; preload results from a previous
+        # folder are dropped when their generation no longer matches.
+        self._folder_generation = 0
+        # Pending debounce timer for coalesced config saves (see _schedule_save)
+        self._save_timer = None
+        # Safety net: flush any pending debounced write even if the process
+        # exits without going through on_close (e.g. an unhandled exception)
+        atexit.register(self._flush_save)
+        # Trim the on-disk thumbnail cache in the background at startup
+        self._thumb_pool.submit(prune_thumbnail_cache)
         # Instantiate view using factory for pluggable UI backends
         self.view = create_view(self.config)
         # Remove all window geometry logic; window size/position is now fixed in the view
@@ -32,6 +57,9 @@ class PhotoSorterController:
         
         # Build category buttons
         self.build_category_buttons()
+        # Keyboard shortcuts are global, not per-button: bind them exactly once
+        # here rather than on every category rebuild
+        self.view.bind_keyboard_shortcuts()
 
         # Hook reset button to reset_categories_and_source
         self.view.add_reset_button(self.reset_categories_and_source)
@@ -46,25 +74,21 @@ class PhotoSorterController:
             self.current_folder = Path(folder)
             self.config["last_folder"] = str(folder)
             save_config(self.config)
-            self.images = list_images(self.current_folder)
+            entries = list_images_with_stats(self.current_folder)
+            self.images = [path for path, _ in entries]
+            self.images_stat = [st for _, st in entries]
+            self._images_alive = [True] * len(self.images)
+            self._dead_count = 0
             self.current_index = 0
-            self.thumbnail_cache = {}  # Clear cache when new folder is selected
+            self.thumbnail_cache = OrderedDict()  # Clear cache when new folder is selected
+            self._folder_generation += 1
             # Show the first image immediately for instant feedback
             self.view.set_selected_folder_path(str(folder))
             self.show_current()
-            # Preload thumbnails for the remaining images in the background (excluding the first)
-            def preload_thumbnails():
-                for img_path in self.images[1:self.THUMBNAIL_PRELOAD_COUNT]:
-                    if img_path not in self.thumbnail_cache:
-                        try:
-                            self.thumbnail_cache[img_path] = create_thumbnail(
-                                img_path,
-                                size=(DearPyGuiView.IMAGE_DISPLAY_WIDTH, DearPyGuiView.IMAGE_DISPLAY_HEIGHT)
-                            )
-                        except Exception:
-                            self.thumbnail_cache[img_path] = None
-            if len(self.images) > 1:
-                threading.Thread(target=preload_thumbnails, daemon=True).start()
+            # Preload thumbnails for the remaining images in parallel (excluding the first)
+            generation = self._folder_generation
+            for img_path in self.images[1:self.THUMBNAIL_PRELOAD_COUNT]:
+                self._thumb_pool.submit(self._preload_thumbnail, img_path, generation)
         elif self.current_folder is not None:
             # If user cancels, keep showing the last selected folder
             self.view.set_selected_folder_path(str(self.current_folder))
@@ -78,61 +102,145 @@ class PhotoSorterController:
             self.view.update_status("No images found")
             return
         img_path = self.images[self.current_index]
-        # Use cached thumbnail if available, else load and cache it
-        pil_thumb = self.thumbnail_cache.get(img_path)
-        if pil_thumb is None:
+        # Use cached thumbnail if available; on a miss, hand the decode to the
+        # worker pool instead of blocking the UI thread on a multi-MP JPEG.
+        # The placeholder shows immediately and the real frame follows as soon
+        # as the worker delivers it (usually one prefetch-miss per folder).
+        # Failed decodes are cached as None, so test membership rather than
+        # the value — a broken image shows the blank frame without being
+        # re-decoded on every visit.
+        if img_path in self.thumbnail_cache:
+            pil_thumb = self.thumbnail_cache[img_path]
+            self.thumbnail_cache.move_to_end(img_path)  # Mark as recently used
+            self.view.show_image(pil_thumb)
+        else:
+            self.view.show_image(None)
+            self._thumb_pool.submit(self._show_async, img_path,
+                                    self._folder_generation)
+        # Reuse the stat result captured during folder enumeration; no extra syscall
+        file_size_kb = self.images_stat[self.current_index].st_size / 1024
+        # Position/total count only the alive (not yet sorted) entries
+        position = self._images_alive[:self.current_index + 1].count(True)
+        total = len(self.images) - self._dead_count
+        self.view.update_status(f"{img_path.name} ({position}/{total})", file_size_kb=file_size_kb)
+        # Warm the neighbours in the background so the next Next/Prev is instant
+        self._prefetch_neighbors()
+
+    def _show_async(self, img_path, generation):
+        """Decode one thumbnail on the worker pool. The display step is
+        marshalled back to the render thread, which re-checks that the image
+        is still the one on screen before painting."""
+        if generation != self._folder_generation:
+            return
+        # A prefetch may have landed (even a cached failure) since the miss
+        # was detected; reuse it instead of decoding again.
+        if img_path in self.thumbnail_cache:
+            thumb = self.thumbnail_cache[img_path]
+        else:
             try:
-                pil_thumb = create_thumbnail(
+                thumb = get_or_build_thumbnail(
                     img_path,
                     size=(DearPyGuiView.IMAGE_DISPLAY_WIDTH, DearPyGuiView.IMAGE_DISPLAY_HEIGHT)
                 )
             except Exception:
-                pil_thumb = None
-            self.thumbnail_cache[img_path] = pil_thumb
-        self.view.show_image(pil_thumb)
-        # Get file size in kilobytes
+                thumb = None
+        if generation != self._folder_generation:
+            return
+        self.view.run_on_ui_thread(
+            lambda: self._show_decoded(img_path, generation, thumb))
+
+    def _show_decoded(self, img_path, generation, thumb):
+        """UI-thread completion for _show_async: cache the result and repaint
+        only if the decoded image is still current and alive — not stale from
+        a folder switch, reset, or an assignment that tombstoned it while the
+        decode was in flight."""
+        if generation != self._folder_generation:
+            return
+        if img_path not in self.thumbnail_cache:
+            self._cache_thumbnail(img_path, thumb)
+        i = self.current_index
+        if (self.images and i < len(self.images)
+                and self.images[i] == img_path and self._images_alive[i]):
+            self.view.show_image(thumb)
+
+    def _preload_thumbnail(self, img_path, generation):
+        """Build one thumbnail on the worker pool; drop the result if stale."""
+        if generation != self._folder_generation or img_path in self.thumbnail_cache:
+            return
         try:
-            file_size_kb = img_path.stat().st_size / 1024
+            thumb = get_or_build_thumbnail(
+                img_path,
+                size=(DearPyGuiView.IMAGE_DISPLAY_WIDTH, DearPyGuiView.IMAGE_DISPLAY_HEIGHT)
+            )
         except Exception:
-            file_size_kb = None
-        self.view.update_status(f"{img_path.name} ({self.current_index+1}/{len(self.images)})", file_size_kb=file_size_kb)
+            thumb = None
+        # Drop stale results if the user switched folders mid-preload
+        if generation == self._folder_generation:
+            self._cache_thumbnail(img_path, thumb)
+
+    def _cache_thumbnail(self, img_path, thumb):
+        """Insert a thumbnail into the LRU cache, evicting the oldest past the cap."""
+        self.thumbnail_cache[img_path] = thumb
+        self.thumbnail_cache.move_to_end(img_path)
+        while len(self.thumbnail_cache) > self.THUMBNAIL_CACHE_SIZE:
+            self.thumbnail_cache.popitem(last=False)
+
+    def _prefetch_neighbors(self):
+        """Submit background builds for images near the current one: two ahead
+        (the common direction while sorting) and one behind."""
+        generation = self._folder_generation
+        ahead = self._find_alive(self.current_index + 1, +1)
+        targets = [ahead, self._find_alive(self.current_index - 1, -1)]
+        if ahead is not None:
+            targets.append(self._find_alive(ahead + 1, +1))
+        for idx in targets:
+            if idx is not None and self.images[idx] not in self.thumbnail_cache:
+                self._thumb_pool.submit(self._preload_thumbnail, self.images[idx], generation)
+
+    def _find_alive(self, start: int, step: int):
+        """Return the first alive image index from start in the given direction, or None."""
+        i = start
+        while 0 <= i < len(self.images):
+            if self._images_alive[i]:
+                return i
+            i += step
+        return None
 
     def next_image(self):
         if not self.images:
             return
-        if self.current_index < len(self.images) - 1:
-            self.current_index += 1
-            # Optionally, preload next thumbnail if approaching end of cache
-            if (self.current_index + 1 < len(self.images)
-                and self.images[self.current_index + 1] not in self.thumbnail_cache
-                and self.current_index + 1 < self.THUMBNAIL_PRELOAD_COUNT + 10):
-                try:
-                    self.thumbnail_cache[self.images[self.current_index + 1]] = create_thumbnail(
-                        self.images[self.current_index + 1],
-                        size=(DearPyGuiView.IMAGE_DISPLAY_WIDTH, DearPyGuiView.IMAGE_DISPLAY_HEIGHT)
-                    )
-                except Exception:
-                    self.thumbnail_cache[self.images[self.current_index + 1]] = None
+        next_index = self._find_alive(self.current_index + 1, +1)
+        if next_index is not None:
+            self.current_index = next_index
+            # Neighbour prefetch happens in show_current, off the click path
             self.show_current()
 
     def prev_image(self):
         if not self.images:
             return
-        if self.current_index > 0:
-            self.current_index -= 1
+        prev_index = self._find_alive(self.current_index - 1, -1)
+        if prev_index is not None:
+            self.current_index = prev_index
             self.show_current()
 
+    def _refresh_categories(self):
+        """Pre-normalize configured categories to (name, path) tuples.
+        Rebuilt only when the config mutates, so per-click handlers do a single
+        tuple index instead of repeated dict lookups and Path construction."""
+        self._categories_norm = [
+            (c.get("name", ""), Path(c["path"]) if c.get("path") else None)
+            for c in self.config.get("categories", [])
+        ]
+
     def build_category_buttons(self, event=None):
-        categories = self.config.get("categories", [])
-        self.view.set_categories(categories)
+        self._refresh_categories()
+        self.view.set_categories(self.config.get("categories", []))
         for idx in range(9):
             self.view.bind_category(idx, self.on_category_click, self.on_category_right)
-        # Activate keyboard shortcuts
-        self.view.bind_keyboard_shortcuts()
 
     def on_category_click(self, idx):
-        categories = self.config.get("categories", [])
-        if idx < len(categories) and categories[idx].get("name") and categories[idx].get("path"):
+        norm = self._categories_norm
+        if idx < len(norm) and norm[idx][0] and norm[idx][1] is not None:
             self.assign_category(idx)
         else:
             self.edit_category(idx)
@@ -165,45 +273,138 @@ class PhotoSorterController:
         configure_category(idx, {"name": current_name, "path": current_path}, _handle_category_config_result)
 
     def assign_category(self, idx):
-        if not self.images or not (0 <= idx < len(self.config["categories"])):
+        if not self.images or not (0 <= idx < len(self._categories_norm)):
             return
         
-        category = self.config["categories"][idx]
-        if not category["name"] or not category["path"]:
+        name, dest_folder = self._categories_norm[idx]
+        if not name or dest_folder is None:
             show_error("Category Not Configured: Please configure this category (name and path) before assigning images.")
             return
 
         img_path = self.images[self.current_index]
-        dest_folder = Path(category["path"])
         
         try:
-            move_image(img_path, dest_folder)
-            # Remove moved image from list and update display
-            self.images.pop(self.current_index)
-            if not self.images: # No more images
+            # Run the move on the I/O pool and advance the UI immediately;
+            # same-filesystem moves are a single rename, but cross-device
+            # moves degrade to a full copy that would otherwise freeze the UI
+            self._io_pool.submit(self._move_image_bg, img_path, dest_folder,
+                                 self._folder_generation)
+            # Mark the moved image as dead instead of list.pop(index), which
+            # shifts the whole tail and makes sorting a large folder O(n^2).
+            # The boolean tombstone list plus periodic compaction keeps each
+            # assignment amortized O(1) while preserving stable indices for
+            # the parallel stat list (a removed-index set would be equivalent
+            # but costs a hash lookup per navigation step).
+            self._images_alive[self.current_index] = False
+            self._dead_count += 1
+            next_index = self._find_alive(self.current_index + 1, +1)
+            if next_index is None:
+                next_index = self._find_alive(self.current_index - 1, -1)
+            if next_index is None: # No more images
                 self.view.show_image(None)
                 self.view.update_status("All images sorted from this folder!")
                 self.current_folder = None # Reset current folder
                 self.config["last_folder"] = "" # Clear last folder from config
-                save_config(self.config)
+                self._schedule_save()
                 return
 
-            if self.current_index >= len(self.images):
-                self.current_index = len(self.images) - 1
-            
+            self.current_index = next_index
+            # Compact the lists once more than a quarter of the entries are dead
+            if self._dead_count * 4 > len(self.images):
+                self._compact_images()
             self.show_current() # Show next or previous image
         except Exception as e:
             show_error(f"Error Moving Image: Could not move {img_path.name}: {e}")
+
+    def _move_image_bg(self, img_path, dest_folder, generation):
+        """Worker-side file move. Failures are marshalled back to the render
+        thread via the view's UI queue, so all session-state mutation and the
+        error dialog happen on the thread that owns them."""
+        try:
+            move_image(img_path, dest_folder)
+        except Exception as e:
+            self.view.run_on_ui_thread(
+                lambda: self._on_move_failed(img_path, generation, e))
+
+    def _on_move_failed(self, img_path, generation, error):
+        """UI-thread handler for a failed background move: the file is still
+        in the source folder, so put it back in the session and show the error."""
+        if generation != self._folder_generation:
+            return  # Folder switched since the move was submitted
+        try:
+            i = self.images.index(img_path)
+        except ValueError:
+            i = None
+        if i is not None:
+            if not self._images_alive[i]:
+                self._images_alive[i] = True
+                self._dead_count -= 1
+        else:
+            # The tombstone was compacted away; re-insert at the sorted
+            # position (the listing is ordered by lowercased name).
+            try:
+                st = img_path.stat()
+            except OSError:
+                st = None  # Source vanished as well; nothing to restore
+            if st is not None:
+                i = bisect.bisect_left(self.images, img_path.name.lower(),
+                                       key=lambda p: p.name.lower())
+                self.images.insert(i, img_path)
+                self.images_stat.insert(i, st)
+                self._images_alive.insert(i, True)
+                # <= because inserting exactly at current_index also shifts
+                # the viewed entry right; keep showing the same photo.
+                if i <= self.current_index:
+                    self.current_index += 1
+        # If everything else was sorted, navigate to the revived entry so the
+        # session does not sit on a dead index.
+        if (i is not None and self.images
+                and not self._images_alive[self.current_index]):
+            self.current_index = i
+        show_error(f"Error Moving Image: Could not move {img_path.name}: {error}")
+        self.show_current()
     
+    def _compact_images(self):
+        """Drop tombstoned entries from the image lists and remap current_index."""
+        alive = self._images_alive
+        self.current_index = alive[:self.current_index].count(True)
+        self.images = [p for p, a in zip(self.images, alive) if a]
+        self.images_stat = [s for s, a in zip(self.images_stat, alive) if a]
+        self._images_alive = [True] * len(self.images)
+        self._dead_count = 0
+
+    def _schedule_save(self):
+        """Coalesce config writes: (re)start a short timer so rapid-fire sorting
+        produces one disk write instead of one per keypress."""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        self._save_timer = threading.Timer(0.5, self._flush_save)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+
+    def _flush_save(self):
+        """Write any pending config changes to disk immediately."""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+        save_config(self.config)
+
     def reset_categories_and_source(self):
         # Reset categories and last folder in config
         self.config["categories"] = []
         self.config["last_folder"] = ""
         save_config(self.config)
-        # Reset current folder and image state
+        # Reset current folder and image state. Bump the generation so any
+        # in-flight preloads, decodes or move-failure handlers from the old
+        # folder are dropped instead of repopulating the cleared session.
         self.current_folder = None
         self.images = []
+        self.images_stat = []
+        self._images_alive = []
+        self._dead_count = 0
         self.current_index = 0
+        self._folder_generation += 1
+        self.thumbnail_cache = OrderedDict()
         # Rebuild category buttons and clear image
         self.build_category_buttons()
         self.view.show_image(None)
@@ -211,6 +412,20 @@ class PhotoSorterController:
         # Reset the selected folder path and update button label
         self.view.set_selected_folder_path("")
 
+    def run(self):
+        """Start the UI main loop. Single entry point used by __main__."""
+        self.view.mainloop()
+
+    def cleanup(self):
+        """Release background resources; safe to call more than once."""
+        # Flush any pending debounced config write before exiting
+        self._flush_save()
+        # Drop queued preload work so shutdown is not delayed by pending decodes
+        self._thumb_pool.shutdown(wait=False, cancel_futures=True)
+        # File moves must complete — wait for them before exiting
+        self._io_pool.shutdown(wait=True)
+
     def on_close(self):
         """Handle window close event by quitting the application."""
+        self.cleanup()
         self.view.quit()
@@ -0,0 +1,42 @@
+# imageops.py
+# NumPy-based helpers for pixel-level image processing.
+# Any per-pixel work in this project (auto-orientation, histograms, dedupe, ...)
+# must go through vectorized NumPy operations on uint8 arrays — Python
+# `for y/for x` pixel loops are orders of magnitude too slow at photo
+# resolutions and are not acceptable here. Functions in this module take and
+# return HxW or HxWxC uint8 ndarrays; use the converters below at the PIL boundary.
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+import numpy as np
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+
+def to_ndarray(pil_img: "Image.Image") -> np.ndarray:
+    """
+    Convert a PIL image to a uint8 ndarray (HxW or HxWxC).
+    np.asarray shares the decoded buffer where possible, so this is
+    effectively zero-copy.
+    """
+    return np.asarray(pil_img)
+
+
+def from_ndarray(arr: np.ndarray) -> "Image.Image":
+    """Convert a uint8 ndarray (HxW or HxWxC) back to a PIL image."""
+    from PIL import Image
+    return Image.fromarray(arr)
+
+
+def luminance_histogram(arr: np.ndarray, bins: int = 256) -> np.ndarray:
+    """
+    Return the luminance histogram of an image array as int64 counts.
+    Uses the Rec. 601 luma weights for color images; fully vectorized.
+    """
+    if arr.ndim == 3:
+        luma = (arr[:, :, :3] @ np.array([0.299, 0.587, 0.114])).astype(np.uint8)
+    else:
+        luma = arr
+    return np.bincount(luma.ravel(), minlength=bins)
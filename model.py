@@ -2,40 +2,257 @@
 # Contains functions for file operations: listing images, moving images, and creating thumbnails.
 # This file encapsulates data and file manipulation logic, following the MVC pattern for separation of concerns.
 
+from __future__ import annotations
+
 from pathlib import Path
+import errno
+import functools
+import hashlib
 import os
 import shutil
-from PIL import Image  # Only import Image, not ImageTk
+from typing import TYPE_CHECKING
+import PIL  # Top-level package only; PIL.Image (the heavy part) is imported lazily
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+# Pillow-SIMD is a drop-in replacement for Pillow whose resize kernels use
+# SSE4/AVX2, making LANCZOS resampling several times faster. It publishes
+# versions like "9.0.0.post1", so a ".post" suffix identifies a SIMD build.
+# No code change is needed to benefit from it; install via requirements-simd.txt.
+PILLOW_SIMD = '.post' in getattr(PIL, '__version__', '')
+
+def _pil_image():
+    """
+    Import and return the PIL.Image module on first use.
+    Deferring this import (typically 50-150ms) lets the window appear before
+    Pillow loads; repeat calls are just a sys.modules dict lookup.
+    """
+    from PIL import Image
+    return Image
+
+# MIME type per supported extension. File classification in this project is
+# by extension only — never by opening the file or sniffing magic bytes, which
+# would add a file-open per entry to every directory scan.
+MIME_BY_EXT = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.bmp': 'image/bmp',
+    '.gif': 'image/gif',
+    '.tif': 'image/tiff',
+    '.tiff': 'image/tiff',
+    '.webp': 'image/webp',
+}
+
+# Supported image file extensions, cached at module level so the tuple is built only once.
+SUPPORTED_EXTENSIONS = tuple(MIME_BY_EXT)
+
+# frozenset view of the same extensions for O(1) membership tests during
+# directory scans (endswith on a tuple is a linear scan per file).
+IMG_EXTS = frozenset(MIME_BY_EXT)
+
+# Translation table mapping characters that are invalid in filenames to '_'.
+# str.translate is a single C loop over the string — far cheaper than running
+# the regex engine per call — and non-ASCII characters pass through untouched.
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '\\/:*?"<>|'})
+
+def sanitize_filename(name: str) -> str:
+    """
+    Return the given filename with characters invalid on common filesystems
+    replaced by underscores. Used when deriving filenames from user input
+    (e.g. the planned category-based renaming).
+    """
+    return name.translate(_SANITIZE_TABLE)
+
+def guess_mime_type(filename: str) -> str | None:
+    """
+    Return the MIME type for a filename based on its extension alone,
+    or None if it is not a supported image type.
+    """
+    return MIME_BY_EXT.get(os.path.splitext(filename)[1].lower())
+
+# Directory for the persistent thumbnail cache, shared across sessions.
+# Re-visiting a folder then only costs a small JPEG decode per image instead
+# of a full-resolution decode and resize.
+THUMBNAIL_CACHE_DIR = Path.home() / ".cache" / "photo_sorter"
+
+def list_images_with_stats(folder: Path) -> list[tuple[Path, os.stat_result]]:
+    """
+    Return a sorted list of (path, stat_result) pairs for images in the folder.
+    Uses os.scandir instead of os.listdir: DirEntry objects carry cached
+    file-type and stat info, so no extra stat syscall is needed per entry —
+    callers can reuse the stat result (e.g. file size) without hitting the
+    filesystem again.
+    """
+    with os.scandir(folder) as it:
+        entries = [entry for entry in it
+                   if entry.is_file(follow_symlinks=False)
+                   and os.path.splitext(entry.name)[1].lower() in IMG_EXTS]
+    # Sort the DirEntry objects by lowercased name before building Path objects:
+    # cheaper sort keys, and case-insensitive order matches what users expect.
+    # Paths are materialized exactly once per entry, after filtering and
+    # sorting, from the ready-made entry.path string — everything downstream
+    # (moving, statting, cache keys) works in terms of Path, so dropping to raw
+    # strings here would just push the conversion cost to every consumer.
+    entries.sort(key=lambda entry: entry.name.lower())
+    return [(Path(entry.path), entry.stat()) for entry in entries]
 
 def list_images(folder: Path) -> list[Path]:
     """
     Return a sorted list of image file paths in the given folder.
     """
-    supported = ('.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tif', '.tiff', '.webp')
-    return sorted([folder / f for f in os.listdir(folder)
-                   if f.lower().endswith(supported)])
+    return [path for path, _ in list_images_with_stats(folder)]
+
+def iter_images(folder: Path):
+    """
+    Lazily yield image file paths in the given folder, in directory order.
+    Unlike list_images this never materializes or sorts the full listing, so
+    it stays O(1) memory on huge folders — use it for code paths that only
+    need a handful of entries (e.g. "does this folder contain any images?").
+    """
+    with os.scandir(folder) as it:
+        for entry in it:
+            if (entry.is_file(follow_symlinks=False)
+                    and os.path.splitext(entry.name)[1].lower() in IMG_EXTS):
+                yield Path(entry.path)
 
 def move_image(src: Path, dest_folder: Path) -> None:
     """
     Move image file to the destination folder.
-    Raises exception on failure.
+    Uses os.replace as a fast path: when source and destination are on the
+    same filesystem — the common case when sorting into subfolders — the move
+    is a single rename syscall with no data copied. Falls back to shutil.move
+    (copy + unlink) only for cross-device moves.
+    Raises FileExistsError if the destination already holds a file with the
+    same name (os.replace would silently clobber it; the caller surfaces the
+    error and both files survive), or another exception on failure.
     """
     dest_folder.mkdir(parents=True, exist_ok=True)
-    shutil.move(str(src), str(dest_folder))
+    dest = dest_folder / src.name
+    if dest.exists():
+        raise FileExistsError(f"Destination path '{dest}' already exists")
+    try:
+        os.replace(src, dest)
+    except OSError as e:
+        if e.errno == errno.EXDEV:
+            # Pass the folder, not the file path: shutil.move onto a directory
+            # refuses to overwrite a same-named file that appeared meanwhile.
+            shutil.move(str(src), str(dest_folder))
+        else:
+            raise
 
 def create_thumbnail(image_path: Path, size) -> Image.Image:
     """
     Create a thumbnail for the given image path and return a PIL Image object.
     Preserves aspect ratio and centers the image on a neutral background.
     """
+    Image = _pil_image()
     img = Image.open(image_path)
-    img = img.convert("RGBA")
-    # Use thumbnail to preserve aspect ratio
-    img.thumbnail(size, Image.Resampling.LANCZOS)
+    # For JPEGs, ask the decoder for a draft at roughly 2x the target size.
+    # libjpeg can then decode at 1/2, 1/4 or 1/8 scale (DCT scaling), which is
+    # much faster than decoding the full-resolution image and resizing down.
+    # draft() must run before any operation that loads pixel data; for
+    # non-JPEG formats it is a no-op and the full decode path runs.
+    # Note: embedded EXIF thumbnails (at most 320x240) are deliberately not
+    # used as a source — they are always smaller than the display target, so
+    # showing them verbatim would mean upscaling a lossy preview.
+    img.draft('RGB', (size[0] * 2, size[1] * 2))
+    # Skip the resample entirely when the source already fits the target box
+    # (common for screenshots and small PNGs); compositing below still pads it
+    # to the fixed display size.
+    if img.width > size[0] or img.height > size[1]:
+        # Use thumbnail to preserve aspect ratio; reducing_gap enables Pillow's
+        # two-stage resample (fast box reduce, then a final filtered step).
+        # BILINEAR is 3-5x cheaper than LANCZOS and visually equivalent at
+        # preview sizes; with Pillow-SIMD installed it is vectorized as well.
+        img.thumbnail(size, Image.Resampling.BILINEAR, reducing_gap=2.0)
     # Create a neutral background (dark gray)
     background = Image.new("RGBA", size, (30, 30, 30, 255))
     # Center the image
     x = (size[0] - img.width) // 2
     y = (size[1] - img.height) // 2
-    background.paste(img, (x, y), img)
+    if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+        # Images with transparency need an alpha-aware paste
+        if img.mode != "RGBA":
+            img = img.convert("RGBA")
+        background.paste(img, (x, y), img)
+    else:
+        # Opaque images (JPEGs decode as RGB) paste directly — no full-frame
+        # convert("RGBA") copy needed; paste handles the mode adaptation in C
+        background.paste(img, (x, y))
     return background  # Return the PIL Image object
+
+def _thumbnail_cache_path(path_str: str, mtime_ns: int, st_size: int, w: int, h: int) -> Path:
+    """
+    Return the on-disk cache location for a thumbnail of the given image.
+    The key hashes (path, mtime, file size, thumbnail size), so a modified or
+    replaced source file never matches a stale cache entry.
+    blake2b is used because it is fast; cache keying needs no cryptographic strength.
+    """
+    key = hashlib.blake2b(
+        f"{path_str}|{mtime_ns}|{st_size}|{w}x{h}".encode(),
+        digest_size=16
+    ).hexdigest()
+    return THUMBNAIL_CACHE_DIR / key[:2] / f"{key}.jpg"
+
+@functools.lru_cache(maxsize=128)
+def _cached_thumbnail(path_str: str, mtime_ns: int, st_size: int, w: int, h: int) -> Image.Image:
+    """
+    Memoized thumbnail builder keyed by (path, mtime, size, dimensions).
+    The lru_cache layer makes Next/Prev oscillation free; the on-disk layer
+    below it makes repeat sessions cheap. Cache write failures are ignored so
+    a read-only cache dir never breaks display.
+    """
+    Image = _pil_image()
+    cache_file = _thumbnail_cache_path(path_str, mtime_ns, st_size, w, h)
+    if cache_file.exists():
+        try:
+            return Image.open(cache_file).convert("RGBA")
+        except Exception:
+            pass  # Corrupt cache entry; rebuild below
+    thumb = create_thumbnail(Path(path_str), (w, h))
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        thumb.convert("RGB").save(cache_file, "JPEG", quality=85, optimize=False)
+    except OSError:
+        pass
+    return thumb
+
+def prune_thumbnail_cache(max_bytes: int = 256 * 1024 * 1024) -> None:
+    """
+    Evict least-recently-used entries from the on-disk thumbnail cache until
+    its total size is at or below max_bytes. Recency comes from file access
+    times, which cache hits refresh. Intended to run in the background at
+    startup; errors are ignored since the cache is purely an optimization.
+    """
+    try:
+        files = [(f, f.stat()) for f in THUMBNAIL_CACHE_DIR.rglob("*.jpg")]
+    except OSError:
+        return
+    total = sum(st.st_size for _, st in files)
+    if total <= max_bytes:
+        return
+    # Oldest access time first
+    files.sort(key=lambda pair: pair[1].st_atime)
+    for f, st in files:
+        try:
+            f.unlink()
+        except OSError:
+            continue
+        total -= st.st_size
+        if total <= max_bytes:
+            break
+
+def get_or_build_thumbnail(image_path: Path, size) -> Image.Image:
+    """
+    Return a thumbnail for the given image, using the in-memory LRU and the
+    persistent on-disk cache. Falls back to a direct build if the source
+    cannot be stat'ed (e.g. it vanished between listing and display).
+    """
+    try:
+        st = image_path.stat()
+    except OSError:
+        return create_thumbnail(image_path, size)
+    return _cached_thumbnail(str(image_path.resolve()), st.st_mtime_ns, st.st_size,
+                             size[0], size[1])
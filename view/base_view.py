@@ -66,6 +66,12 @@ class BaseView(ABC):
         """Start the main event loop for the UI."""
         pass
 
+    @abstractmethod
+    def run_on_ui_thread(self, fn: Callable) -> None:
+        """Queue a callable to run on the UI thread at the next frame.
+        Safe to call from background threads."""
+        pass
+
     @abstractmethod
     def set_selected_folder_path(self, folder_path: str) -> None:
         """Update the displayed selected folder path next to the Select Folder button."""
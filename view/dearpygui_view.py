@@ -10,14 +10,27 @@ Key responsibilities:
 - Provide visual feedback for navigation and category selection
 - Support modular callbacks for controller integration
 """
+from __future__ import annotations
+
+from collections import OrderedDict, deque
 from pathlib import Path
+import os
+import time
 import dearpygui.dearpygui as dpg
 from view.base_view import BaseView
-import numpy as np
-from PIL import Image
-from typing import Optional, Callable, Dict, List
+from typing import TYPE_CHECKING, Optional, Callable, Dict, List
 import threading
 
+# numpy and PIL are only needed once an image is actually displayed; importing
+# them lazily in show_image keeps their cost (~100ms combined cold) off the
+# startup path so the window appears sooner.
+if TYPE_CHECKING:
+    from PIL import Image
+
+# Viewport icon, resolved once at import time; the path never changes at
+# runtime, so there is no reason to rebuild and re-stringify it per instance.
+_ICON_PATH = str(Path(__file__).parent / "icon.ico")
+
 # Main DearPyGui-based view class for the photo sorter application
 class DearPyGuiView(BaseView):
     _instance = None  # Singleton instance for global access
@@ -30,7 +43,6 @@ class DearPyGuiView(BaseView):
     TAG_STATUS_TEXT = "status_text"
     TAG_IMAGE_DISPLAY = "image_display"
     TAG_IMAGE_TEXTURE = "image_texture"
-    TAG_PLACEHOLDER_TEXTURE = "placeholder_texture"
     TAG_IMAGE_AREA = "image_area_group"
     TAG_PREV_BUTTON = "prev_button"
     TAG_NEXT_BUTTON = "next_button"
@@ -42,6 +54,17 @@ class DearPyGuiView(BaseView):
     IMAGE_DISPLAY_WIDTH = 576
     IMAGE_DISPLAY_HEIGHT = 360
     CATEGORY_BUTTON_WIDTH = 231
+    # Max number of prepared texture buffers kept per PIL image (see show_image).
+    # Each entry is ~3MB of float data, so 64 bounds the cache at ~200MB worst case
+    # while making Prev/Next on recently shown images skip the conversion entirely.
+    TEXTURE_CACHE_SIZE = 64
+    # Number keys 1-9 for category shortcuts, in category order. Spelled out
+    # as a tuple rather than derived with mvKey_1 + i so registration does no
+    # arithmetic on enum values (an implementation detail of DPG's constants).
+    CATEGORY_KEYS = (dpg.mvKey_1, dpg.mvKey_2, dpg.mvKey_3,
+                     dpg.mvKey_4, dpg.mvKey_5, dpg.mvKey_6,
+                     dpg.mvKey_7, dpg.mvKey_8, dpg.mvKey_9)
+    _KEY_TO_CATEGORY = {key: i for i, key in enumerate(CATEGORY_KEYS)}
 
     def __init__(self):
         # --- Initialize Dear PyGui context and compute viewport position/size ---
@@ -56,27 +79,26 @@ class DearPyGuiView(BaseView):
         self.width = self.DEFAULT_WIDTH
         self.height = self.DEFAULT_HEIGHT
 
-        # Compute centered position for the viewport on the primary monitor
+        # Compute centered position for the viewport on the primary monitor.
+        # The hidden Tk root created for the probe is kept (see _get_hidden_tk)
+        # so the first folder dialog does not pay a second Tcl startup.
+        self._tk_root = None
         try:
-            import tkinter as tk
-            root = tk.Tk()
-            root.withdraw()
+            root = self._get_hidden_tk()
             screen_width = root.winfo_screenwidth()
             screen_height = root.winfo_screenheight()
-            root.destroy()
             x_pos = max((screen_width - self.width) // 2, 0)
             y_pos = max((screen_height - self.height) // 2, 0)
         except Exception:
             x_pos, y_pos = 0, 0
 
-        icon_path = Path(__file__).parent / "icon.ico"
         # Store viewport parameters for later creation
         self._viewport_params = {
             "title": "Photo Sorter",
             "width": self.width,
             "height": self.height,
-            "small_icon": str(icon_path),
-            "large_icon": str(icon_path),
+            "small_icon": _ICON_PATH,
+            "large_icon": _ICON_PATH,
             "x_pos": x_pos,
             "y_pos": y_pos
         }
@@ -87,26 +109,47 @@ class DearPyGuiView(BaseView):
 
         # --- Build all UI widgets and windows, with viewport parameters ready ---
         with dpg.texture_registry() as self.texture_registry:
-            dpg.add_dynamic_texture(
-                width=1,
-                height=1,
-                default_value=[0.0, 0.0, 0.0, 0.0],
-                tag=self.TAG_PLACEHOLDER_TEXTURE
-            )
-            initial_texture_data = [0.0] * (self.IMAGE_DISPLAY_WIDTH * self.IMAGE_DISPLAY_HEIGHT * 4)
-            dpg.add_dynamic_texture(
+            # Raw texture: DearPyGui renders straight from the buffer
+            # registered here, so writing into it in place updates the texture
+            # with no set_value call and no per-frame reparse. The buffer must
+            # stay alive for the lifetime of the texture, hence the attribute.
+            # array.array keeps the zero-filled initial buffer cheap without
+            # importing numpy at startup (it is deferred to first display);
+            # show_image wraps it as an ndarray view on first use.
+            import array
+            self._tex_buffer = array.array('f', bytes(4 * self.IMAGE_DISPLAY_WIDTH * self.IMAGE_DISPLAY_HEIGHT * 4))
+            self._tex_buffer_np = None  # numpy view of _tex_buffer, made lazily
+            dpg.add_raw_texture(
                 width=self.IMAGE_DISPLAY_WIDTH,
                 height=self.IMAGE_DISPLAY_HEIGHT,
-                default_value=initial_texture_data,
+                default_value=self._tex_buffer,
+                format=dpg.mvFormat_Float_rgba,
                 tag=self.TAG_IMAGE_TEXTURE
             )
 
         # --- Theme creation (optimized) ---
         self._themes = self._create_all_themes()
         self._category_button_ids = dict()
-        self._feedback_timers = dict()
+        # Button-feedback pulses pending restoration, key -> monotonic deadline.
+        # Keys are category indices (int) or 'nav_prev'/'nav_next'. Expired
+        # entries are restored by the render loop in mainloop — no timer
+        # threads and no theme mutations from foreign threads.
+        self._feedback_deadlines = dict()
+        # Callables queued from background threads, drained by the render loop
+        # each frame; deque append/popleft are atomic, so no lock is needed.
+        self._ui_queue = deque()
         self._nav_button_ids = dict()
 
+        # One shared right-click handler registry for all category buttons.
+        # A per-button registry would be recreated (and leaked — deleting the
+        # container's children does not delete registries) on every rebuild;
+        # the dispatch callback recovers the index from the button's user_data.
+        with dpg.item_handler_registry() as self._cat_right_handler:
+            dpg.add_item_clicked_handler(
+                button=dpg.mvMouseButton_Right,
+                callback=self._on_category_right_dispatch
+            )
+
         # --- Build main window and layout ---
         with dpg.window(label="", tag=self.TAG_MAIN_WINDOW, no_close=True, no_collapse=True, no_move=True, no_title_bar=True, no_resize=True, width=self.width, height=self.height, pos=[0,0]):
             self._build_menu_bar()
@@ -127,20 +170,51 @@ class DearPyGuiView(BaseView):
             dpg.add_spacer(height=20)
 
         # --- Responsive centering on viewport resize ---
-        def _on_viewport_resize():
+        # Dragging the window edge fires a resize event per WM_SIZE message —
+        # sometimes one per pixel. Coalesce them with a trailing-edge debounce
+        # so the relayout runs once, 50ms after the drag settles, and skip the
+        # configure calls entirely when the size did not actually change. The
+        # timer only queues the relayout; the configure calls themselves run
+        # on the render thread when mainloop drains the UI queue.
+        self._resize_timer = None
+        self._last_viewport_size = (self.width, self.height)
+
+        def _apply_viewport_resize():
             vp_width = dpg.get_viewport_client_width()
+            vp_height = dpg.get_viewport_client_height()
+            if (vp_width, vp_height) == self._last_viewport_size:
+                return
+            self._last_viewport_size = (vp_width, vp_height)
             content_width = 2 * 40 + self.IMAGE_DISPLAY_WIDTH + 120
             side_space = max((vp_width - content_width) // 2, 0)
             dpg.configure_item("left_spacer", width=side_space)
             dpg.configure_item("right_spacer", width=side_space)
-            dpg.configure_item(self.TAG_MAIN_WINDOW, width=vp_width, height=dpg.get_viewport_client_height(), pos=[0, 0])
+            dpg.configure_item(self.TAG_MAIN_WINDOW, width=vp_width, height=vp_height, pos=[0, 0])
             dpg.configure_item(self.TAG_RESET_BUTTON, pos=[vp_width-70, 30])
+
+        def _on_viewport_resize():
+            if self._resize_timer is not None:
+                self._resize_timer.cancel()
+            self._resize_timer = threading.Timer(
+                0.05, self.run_on_ui_thread, args=(_apply_viewport_resize,))
+            self._resize_timer.daemon = True
+            self._resize_timer.start()
         dpg.set_viewport_resize_callback(_on_viewport_resize)
 
         # --- Initialize callback and state dictionaries ---
         self._callbacks: Dict[str, Callable] = {}
         self._category_callbacks: Dict[int, Dict[str, Callable]] = {}
+        # Snapshot of the last category list applied to the grid, used by
+        # set_categories to skip refreshes that would change nothing.
+        self._last_categories = None
         self._modal_open = False  # Track if a modal dialog is open
+        # LRU of prepared texture buffers keyed by id(photo), with the source
+        # PIL object stored in each entry so the id stays valid; re-showing a
+        # cached thumbnail then skips the pixel conversion.
+        self._texture_cache: OrderedDict = OrderedDict()
+        # Whether the view currently shows the blank (all-zero) frame; lets
+        # repeated show_image(None) calls skip re-clearing the buffer.
+        self._showing_blank = True
 
     def _create_theme(self, button_color, hover_color, active_color, padding=(12, 8)):
         """Helper function to create a theme with consistent styling."""
@@ -278,58 +352,103 @@ class DearPyGuiView(BaseView):
         if self._callbacks.get("reset"):
             self._callbacks["reset"]()
 
+    def _get_hidden_tk(self):
+        """Return the shared hidden Tk root, creating it on first use.
+        Creating a Tk root spins up a whole Tcl interpreter (tens of ms), so
+        one withdrawn root serves both the screen-size probe and every folder
+        dialog for the life of the view."""
+        if self._tk_root is None:
+            import tkinter as tk
+            self._tk_root = tk.Tk()
+            self._tk_root.withdraw()
+        return self._tk_root
+
     # --- Folder Selection Dialog ---
     def ask_for_folder(self) -> str:
         """Show a native folder selection dialog and return the selected path."""
-        import tkinter as tk
         from tkinter import filedialog
-        root = tk.Tk()
-        root.withdraw()
-        folder_selected = filedialog.askdirectory(title="Select Source Folder")
-        root.destroy()
+        folder_selected = filedialog.askdirectory(title="Select Source Folder",
+                                                  parent=self._get_hidden_tk())
         return folder_selected or ""
 
     # --- Image Display ---
     def show_image(self, photo: Optional[Image.Image]) -> None:
         """Display a PIL image in the DearPyGui window."""
-        FIXED_WIDTH, FIXED_HEIGHT = self.IMAGE_DISPLAY_WIDTH, self.IMAGE_DISPLAY_HEIGHT
         if photo is None:
-            if dpg.does_item_exist(self.TAG_IMAGE_DISPLAY):
-                dpg.configure_item(self.TAG_IMAGE_DISPLAY, texture_tag=self.TAG_PLACEHOLDER_TEXTURE, width=FIXED_WIDTH, height=FIXED_HEIGHT)
+            # The widget stays bound to the one raw texture; blanking is just
+            # zeroing its buffer (the startup state), so no widget reconfigure
+            # or texture rebind ever happens. Skip the refill when the view is
+            # already blank — including at startup, before any image was shown.
+            if not self._showing_blank and self._tex_buffer_np is not None:
+                self._tex_buffer_np.fill(0.0)
+            self._showing_blank = True
             return
-        if photo.mode != "RGBA":
-            photo = photo.convert("RGBA")
-        # Efficient conversion to numpy array and ensure 4 channels
-        img_array = np.asarray(photo, dtype=np.float32) / 255.0
-        if img_array.ndim == 2:
-            img_array = np.stack([img_array, img_array, img_array, np.ones_like(img_array)], axis=-1)
-        elif img_array.shape[2] == 3:
-            alpha = np.ones((*img_array.shape[:2], 1), dtype=np.float32)
-            img_array = np.concatenate((img_array, alpha), axis=-1)
-        elif img_array.shape[2] > 4:
-            img_array = img_array[:, :, :4]
-        if not img_array.flags['C_CONTIGUOUS']:
-            img_array = np.ascontiguousarray(img_array)
-        img_list = img_array.flatten().tolist()
-        dpg.set_value(self.TAG_IMAGE_TEXTURE, img_list)
-        if dpg.does_item_exist(self.TAG_IMAGE_DISPLAY):
-            dpg.configure_item(self.TAG_IMAGE_DISPLAY, 
-                               texture_tag=self.TAG_IMAGE_TEXTURE, 
-                               width=FIXED_WIDTH, 
-                               height=FIXED_HEIGHT)
-        dpg.set_item_label(self.TAG_IMAGE_DISPLAY, f"{FIXED_WIDTH}x{FIXED_HEIGHT}")
+        self._showing_blank = False
+        # Reuse the prepared texture buffer if this image was shown recently;
+        # the float conversion below costs several ms per 576x360 frame.
+        # PIL Image objects define __eq__ without __hash__ and so cannot be
+        # dict keys themselves; key on id() instead and keep the source object
+        # in the entry, which pins that id for as long as the entry lives.
+        import numpy as np  # Deferred: see module-level note on heavy imports
+        cache_key = id(photo)
+        entry = self._texture_cache.get(cache_key)
+        if entry is not None:
+            tex_data = entry[1]
+            self._texture_cache.move_to_end(cache_key)
+        else:
+            source = photo  # The object whose id keys the entry
+            if photo.mode != "RGBA":
+                photo = photo.convert("RGBA")
+            # The convert above guarantees an HxWx4 uint8 array, so no
+            # channel-promotion branches are needed. Multiply straight into the
+            # flat float32 buffer that the cache will own: one allocation per
+            # miss, no intermediate 2D result, no flatten/contiguity copies.
+            # (A single reusable scratch buffer would be cheaper still, but
+            # every entry in _texture_cache must own its pixels, so the buffer
+            # cannot be shared across images.)
+            tex_data = np.empty(photo.height * photo.width * 4, dtype=np.float32)
+            np.multiply(np.asarray(photo).reshape(-1), np.float32(1.0 / 255.0),
+                        out=tex_data)
+            self._texture_cache[cache_key] = (source, tex_data)
+            while len(self._texture_cache) > self.TEXTURE_CACHE_SIZE:
+                self._texture_cache.popitem(last=False)
+        if self._tex_buffer_np is None:
+            self._tex_buffer_np = np.frombuffer(self._tex_buffer, dtype=np.float32)
+        # The copy into the registered buffer IS the upload: the raw texture
+        # renders from that memory, so one memcpy replaces the set_value round
+        # trip. Done under the render mutex so a frame never samples a
+        # half-written buffer.
+        with dpg.mutex():
+            np.copyto(self._tex_buffer_np, tex_data)
     
     # --- Cleanup and Main Loop ---
     def destroy(self) -> None:
         """Clean up DearPyGui resources and close the window."""
         if self._callbacks.get("close"):
             self._callbacks["close"]()
+        if getattr(self, "_tk_root", None) is not None:
+            self._tk_root.destroy()
+            self._tk_root = None
         dpg.destroy_context()
     
     def mainloop(self, n: int = 0, **kwargs) -> None:
         """Start the DearPyGui main loop."""
         dpg.show_viewport()
-        dpg.start_dearpygui()
+        # Manual render loop instead of start_dearpygui: feedback pulses are
+        # restored and queued UI work runs at frame boundaries on this thread,
+        # so background threads never mutate DPG state directly. Both checks
+        # are no-ops when nothing is pending.
+        while dpg.is_dearpygui_running():
+            if self._feedback_deadlines:
+                self._restore_expired_feedback()
+            while self._ui_queue:
+                self._ui_queue.popleft()()
+            dpg.render_dearpygui_frame()
+
+    def run_on_ui_thread(self, fn: Callable) -> None:
+        """Queue a callable to run on the render thread at the next frame.
+        Safe to call from background threads."""
+        self._ui_queue.append(fn)
     
     def quit(self) -> None:
         """Exit the application."""
@@ -345,51 +464,62 @@ class DearPyGuiView(BaseView):
         dpg.set_value("status_text", status)
     
     # --- Category Button Creation and Management ---
-    def _create_category_button(self, idx: int, cat: Dict[str, str], parent: str) -> None:
-        """Helper function to create a single category button with all handlers, theme, and tooltip."""
-        name = cat.get("name", "")
-        path = cat.get("path", "")
-        button_text = f"{idx + 1}: {name}" if name else f"{idx + 1}: [Empty]"
-        btn_id = dpg.generate_uuid()
-        btn = dpg.add_button(
-            label=button_text,
-            callback=lambda s, a, u: self._on_category_click(u),
-            user_data=idx,
-            width=self.CATEGORY_BUTTON_WIDTH,
-            tag=btn_id,
-            parent=str(parent)
-        )
-        # Use defined theme if both name and path are set, else use default
-        theme = self._themes['category_defined'] if (name and path) else self._themes['category']
-        dpg.bind_item_theme(btn, theme)
-        self._category_button_ids[idx] = btn_id
-        if path:
-            with dpg.tooltip(btn_id):
-                dpg.add_text(path)
-        with dpg.item_handler_registry() as handler_id:
-            dpg.add_item_clicked_handler(
-                button=dpg.mvMouseButton_Right,
-                callback=lambda s, a, u: self._on_category_right_click(u),
-                user_data=idx
-            )
-        dpg.bind_item_handler_registry(btn_id, handler_id)
+    def _build_category_grid(self) -> None:
+        """Create the fixed 3x3 grid of category buttons and tooltips once.
+        Buttons have stable tags and are updated in place by set_categories."""
+        with dpg.mutex():
+            for row in range(3):
+                with dpg.group(parent=self.TAG_CATEGORIES_CONTAINER, horizontal=True):
+                    for col in range(3):
+                        idx = row * 3 + col
+                        btn_id = f"cat_btn_{idx}"
+                        dpg.add_button(
+                            label="",
+                            callback=self._cat_click_cb,
+                            user_data=idx,
+                            width=self.CATEGORY_BUTTON_WIDTH,
+                            tag=btn_id
+                        )
+                        self._category_button_ids[idx] = btn_id
+                        with dpg.tooltip(btn_id, tag=f"cat_tip_{idx}", show=False):
+                            dpg.add_text("", tag=f"cat_tip_text_{idx}")
+                        dpg.bind_item_handler_registry(btn_id, self._cat_right_handler)
 
     def set_categories(self, categories: List[Dict[str, str]]) -> None:
-        """Set up category buttons for image sorting."""
-        if dpg.does_item_exist(self.TAG_CATEGORIES_CONTAINER):
-            dpg.delete_item(self.TAG_CATEGORIES_CONTAINER, children_only=True)
+        """Update category buttons for image sorting, relabeling in place.
+        Deleting and recreating widgets per refresh is far more expensive than
+        mutating the existing ones, so the grid is built exactly once."""
+        if not dpg.does_item_exist("cat_btn_0"):
+            self._build_category_grid()
+        # Rapid state syncs (e.g. several config saves in a row) often re-send
+        # an identical list; skip the 36 widget updates when nothing changed.
+        if categories == self._last_categories:
+            return
+        self._last_categories = [dict(cat) for cat in categories]
         self._category_callbacks.clear()
-        if hasattr(self, '_category_button_ids'):
-            self._category_button_ids.clear()  # Clear button IDs when rebuilding
-        # Arrange buttons in a 3x3 grid (3 rows, 3 buttons per row)
-        for row in range(3):
-            group_id = str(dpg.generate_uuid())
-            with dpg.group(parent=self.TAG_CATEGORIES_CONTAINER, horizontal=True, tag=group_id):
-                pass  # Just to create the group and get its tag
-            for col in range(3):
-                idx = row * 3 + col
-                cat = categories[idx] if idx < len(categories) else {"name": "", "path": ""}
-                self._create_category_button(idx, cat, group_id)
+        # Precompute all labels, paths and themes in one Python pass, then
+        # batch the 9x4 widget mutations under the DPG mutex so the whole grid
+        # refresh is pure DPG calls applied within a single render frame.
+        padded = list(categories[:9]) + [{"name": "", "path": ""}] * (9 - min(len(categories), 9))
+        names = [cat.get("name", "") for cat in padded]
+        paths = [cat.get("path", "") for cat in padded]
+        labels = [f"{idx + 1}: {name}" if name else f"{idx + 1}: [Empty]"
+                  for idx, name in enumerate(names)]
+        # Use defined theme if both name and path are set, else use default
+        themes = [self._themes['category_defined'] if (name and path) else self._themes['category']
+                  for name, path in zip(names, paths)]
+        with dpg.mutex():
+            for idx in range(9):
+                btn_id = self._category_button_ids[idx]
+                dpg.set_item_label(btn_id, labels[idx])
+                dpg.bind_item_theme(btn_id, themes[idx])
+                dpg.set_value(f"cat_tip_text_{idx}", paths[idx])
+                dpg.configure_item(f"cat_tip_{idx}", show=bool(paths[idx]))
+
+    def _cat_click_cb(self, sender, app_data, user_data) -> None:
+        """Shared button callback: one bound method for all nine category
+        buttons instead of a closure per button; user_data is the index."""
+        self._on_category_click(user_data)
 
     def _on_category_click(self, idx: int) -> None:
         """Handle left-click on a category button."""
@@ -398,6 +528,13 @@ class DearPyGuiView(BaseView):
         if idx in self._category_callbacks:
             self._category_callbacks[idx]["click"](idx)
     
+    def _on_category_right_dispatch(self, sender, app_data) -> None:
+        """Shared right-click handler: recover the category index from the
+        clicked button's user_data and dispatch."""
+        idx = dpg.get_item_user_data(app_data[1])
+        if idx is not None:
+            self._on_category_right_click(idx)
+
     def _on_category_right_click(self, idx: int) -> None:
         """Handle right-click on a category button."""
         if idx in self._category_callbacks:
@@ -416,15 +553,21 @@ class DearPyGuiView(BaseView):
         if hasattr(self, '_keyboard_handlers_registered') and self._keyboard_handlers_registered:
             return
         self._keyboard_handlers_registered = True
+        # A single catch-all handler replaces the former 11 registrations (one
+        # per number key plus the arrows): every key event now traverses one
+        # registry entry and dispatches in Python via a dict lookup.
         with dpg.handler_registry():
-            for i in range(9):
-                dpg.add_key_press_handler(
-                    dpg.mvKey_1 + i,
-                    callback=lambda s, a, u: self._handle_keyboard_category(u),
-                    user_data=i
-                )
-            dpg.add_key_press_handler(dpg.mvKey_Left, callback=self._handle_keyboard_prev)
-            dpg.add_key_press_handler(dpg.mvKey_Right, callback=self._handle_keyboard_next)
+            dpg.add_key_press_handler(callback=self._on_key_press)
+
+    def _on_key_press(self, sender, app_data) -> None:
+        """Single key-press dispatcher; app_data is the pressed key code."""
+        idx = self._KEY_TO_CATEGORY.get(app_data)
+        if idx is not None:
+            self._handle_keyboard_category(idx)
+        elif app_data == dpg.mvKey_Left:
+            self._handle_keyboard_prev()
+        elif app_data == dpg.mvKey_Right:
+            self._handle_keyboard_next()
 
     def _handle_keyboard_prev(self):
         """Handle left arrow key for previous image navigation."""
@@ -452,13 +595,16 @@ class DearPyGuiView(BaseView):
 
     def set_selected_folder_path(self, folder_path: str) -> None:
         """Update the displayed selected folder path next to the Select Folder button."""
+        # State syncs can re-set the same folder repeatedly; skip the normpath
+        # and widget updates when nothing changed.
+        if folder_path == getattr(self, "_last_folder_set", None):
+            return
+        self._last_folder_set = folder_path
         if not folder_path:
             dpg.set_value("selected_folder_path", "No folder selected")
             self.update_select_folder_button(False)
         else:
-            import os
-            folder_path = os.path.normpath(folder_path)
-            dpg.set_value("selected_folder_path", folder_path)
+            dpg.set_value("selected_folder_path", os.path.normpath(folder_path))
             self.update_select_folder_button(True)
 
     # --- Visual Feedback for Category and Navigation Buttons ---
@@ -467,54 +613,42 @@ class DearPyGuiView(BaseView):
         if not hasattr(self, '_category_button_ids') or idx not in self._category_button_ids:
             return
         button_id = self._category_button_ids[idx]
-        # Cancel any existing timer for this button
-        if hasattr(self, '_feedback_timers') and idx in self._feedback_timers:
-            timer = self._feedback_timers[idx]
-            if timer:
-                try:
-                    timer.cancel()
-                except Exception:
-                    pass
-            self._feedback_timers[idx] = None
-        # Use a temporary feedback theme
+        # Use a temporary feedback theme; the render loop restores it once the
+        # deadline passes (re-triggering just pushes the deadline out).
         dpg.bind_item_theme(button_id, self._themes['category_feedback'])
-        def restore_theme():
-            if dpg.does_item_exist(button_id):
-                label = dpg.get_item_label(button_id)
-                is_empty = '[Empty]' in label if label else True
-                theme = self._themes['category'] if is_empty else self._themes['category_defined']
-                dpg.bind_item_theme(button_id, theme)
-            if idx in self._feedback_timers:
-                del self._feedback_timers[idx]
-        timer = threading.Timer(duration, restore_theme)
-        self._feedback_timers[idx] = timer
-        timer.start()
+        self._feedback_deadlines[idx] = time.monotonic() + duration
 
     def _show_nav_button_feedback(self, which: str, duration: float = 0.05) -> None:
         """Show visual feedback for a navigation button by temporarily changing its theme."""
         if which not in self._nav_button_ids:
             return
         button_id = self._nav_button_ids[which]
-        if not hasattr(self, '_feedback_timers'):
-            self._feedback_timers = dict()
-        nav_key = f'nav_{which}'
-        if nav_key in self._feedback_timers:
-            self._feedback_timers[nav_key] = None
         # Use the correct independent feedback theme
         if which == 'prev':
             dpg.bind_item_theme(button_id, self._themes['prev_feedback'])
         elif which == 'next':
             dpg.bind_item_theme(button_id, self._themes['next_feedback'])
-        def restore_theme():
-            if self._feedback_timers.get(nav_key) is not None:
-                if which == 'prev':
-                    dpg.bind_item_theme(button_id, self._themes['prev'])
-                elif which == 'next':
-                    dpg.bind_item_theme(button_id, self._themes['next'])
-                if nav_key in self._feedback_timers:
-                    del self._feedback_timers[nav_key]
-        self._feedback_timers[nav_key] = True
-        threading.Timer(duration, restore_theme).start()
+        self._feedback_deadlines[f'nav_{which}'] = time.monotonic() + duration
+
+    def _restore_expired_feedback(self) -> None:
+        """Restore the regular theme on buttons whose feedback pulse elapsed.
+        Runs on the render thread once per frame while pulses are pending."""
+        now = time.monotonic()
+        for key, deadline in list(self._feedback_deadlines.items()):
+            if now < deadline:
+                continue
+            del self._feedback_deadlines[key]
+            if key == 'nav_prev':
+                dpg.bind_item_theme(self._nav_button_ids['prev'], self._themes['prev'])
+            elif key == 'nav_next':
+                dpg.bind_item_theme(self._nav_button_ids['next'], self._themes['next'])
+            else:
+                button_id = self._category_button_ids.get(key)
+                if button_id and dpg.does_item_exist(button_id):
+                    label = dpg.get_item_label(button_id)
+                    is_empty = '[Empty]' in label if label else True
+                    theme = self._themes['category'] if is_empty else self._themes['category_defined']
+                    dpg.bind_item_theme(button_id, theme)
 
     def set_modal_open(self, is_open: bool):
         """Set the modal open state (True if a modal dialog is open)."""
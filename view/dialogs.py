@@ -3,11 +3,13 @@
 # This file keeps UI dialog logic modular and reusable within the view layer.
 
 from typing import Dict, Callable
-from tkinter import filedialog
 import dearpygui.dearpygui as dpg
 import uuid
-import webbrowser
-import tkinter as tk
+
+# tkinter and webbrowser are deliberately not imported at module top: each
+# costs tens of ms cold, and this module is pulled in while the main window is
+# being built. They are imported where used (Browse button, About links), so
+# sessions that never open those dialogs never pay for them.
 
 
 def _center_window(window_id: str, width: int, height: int) -> None:
@@ -97,11 +99,18 @@ def configure_category(idx: int, initial: Dict[str, str], callback: Callable) ->
         dpg.delete_item(window_id)
 
     def _on_browse():
-        # Use native Windows folder selection dialog via tkinter
-        root = tk.Tk()
-        root.withdraw()
-        folder_selected = filedialog.askdirectory(title="Select Destination Folder")
-        root.destroy()
+        # Use native Windows folder selection dialog via tkinter, reusing the
+        # view's hidden root when available to skip the Tcl cold start
+        from tkinter import filedialog
+        if view is not None:
+            folder_selected = filedialog.askdirectory(title="Select Destination Folder",
+                                                      parent=view._get_hidden_tk())
+        else:
+            import tkinter as tk
+            root = tk.Tk()
+            root.withdraw()
+            folder_selected = filedialog.askdirectory(title="Select Destination Folder")
+            root.destroy()
         if folder_selected:
             dpg.set_value(folder_id, folder_selected)
             _update_ok_state()  # Update OK state after browsing
@@ -159,8 +168,15 @@ def show_how_to():
     _center_window(window_id, width, height)
 
 
+# Viewport size the About popup was last centered for; the popup has a fixed
+# size, so recentering is only needed after the viewport actually changed.
+_about_centered_for = None
+
+
 def show_about() -> None:
     """Show the About popup window, centered in the viewport."""
+    global _about_centered_for
+    import webbrowser
     from view.dearpygui_view import DearPyGuiView
     view = _get_view_instance()
     window_id = "about_popup_dialogs"
@@ -200,11 +216,12 @@ def show_about() -> None:
                 dpg.add_button(label="Open GitHub", width=120, callback=lambda: webbrowser.open('https://github.com/gorfreee/photo_sorter'))
                 dpg.add_spacer(width=10)
                 dpg.add_button(label="Close", width=80, callback=close_popup)
-    # Center and show
+    # Center (only when the viewport changed since the last show) and show
     _set_modal_state(view, True)
-    vp_width = dpg.get_viewport_client_width()
-    vp_height = dpg.get_viewport_client_height()
-    x = max((vp_width - width) // 2, 0)
-    y = max((vp_height - height) // 2, 0)
-    dpg.set_item_pos(window_id, [x, y])
+    vp_size = (dpg.get_viewport_client_width(), dpg.get_viewport_client_height())
+    if vp_size != _about_centered_for:
+        x = max((vp_size[0] - width) // 2, 0)
+        y = max((vp_size[1] - height) // 2, 0)
+        dpg.set_item_pos(window_id, [x, y])
+        _about_centered_for = vp_size
     dpg.configure_item(window_id, show=True)